@@ -7,10 +7,16 @@ import sys
 import traceback
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 # Add src to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from voice_agent_course.domain.agents.langgraph_agent import LangGraphAgent
+from voice_agent_course.domain.utils import StreamWriter
 
 
 async def main():
@@ -61,11 +67,16 @@ async def main():
         print("-" * 30)
         user_message = "Get me a random number and the weather in Tokyo"
         print(f"User: {user_message}")
-        print("Agent: ", end="")
+        print("Agent: ", end="", flush=True)
 
-        async for chunk in langgraph_agent.stream(user_message):
-            if chunk:
-                print(chunk, end="", flush=True)
+        writer = StreamWriter()
+        try:
+            async for chunk in langgraph_agent.stream(user_message):
+                if chunk:
+                    writer.write(chunk)
+            writer.flush()
+        finally:
+            await langgraph_agent.aclose()
 
         print("\n")
 
@@ -80,4 +91,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
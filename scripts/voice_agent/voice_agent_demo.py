@@ -4,6 +4,11 @@ import sys
 import traceback
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 # Add src to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
@@ -15,6 +20,7 @@ async def main():
     parser = argparse.ArgumentParser(description="Enhanced Voice Agent Demo with Tools")
     parser.add_argument("--llm-provider", default="groq", help="LLM provider to use (default: groq)")
     parser.add_argument("--llm-model", help="Specific model to use (optional, uses provider default)")
+    parser.add_argument("--quiet", action="store_true", help="Don't echo agent responses to the terminal")
 
     args = parser.parse_args()
 
@@ -32,8 +38,10 @@ async def main():
         voice_agent = VoiceAgent(
             llm_provider=args.llm_provider,
             llm_model=args.llm_model,
+            verbose=not args.quiet,
         )
         print("✅ Agent created successfully!")
+        voice_agent.start_warmup()
 
         # Show agent info
         try:
@@ -49,7 +57,8 @@ async def main():
             print(f"Full traceback:\n{traceback.format_exc()}")
             return
 
-        input("Press Enter to start...")
+        # Wait off the event loop so the LLM warmup runs meanwhile
+        await asyncio.to_thread(input, "Press Enter to start...")
 
         await voice_agent.run_conversation()
     except KeyboardInterrupt:
@@ -60,4 +69,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
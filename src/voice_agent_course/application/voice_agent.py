@@ -1,15 +1,22 @@
 """Voice Agent with LangGraph agent capabilities and tool support."""
 
-import traceback
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from typing import Any
 
+from langchain_core.language_models.chat_models import BaseChatModel
 from loguru import logger
 
 from voice_agent_course.domain.agents.langgraph_agent import LangGraphAgent
+from voice_agent_course.domain.utils import StreamWriter, TokenAccumulator
 
 from ..infrastructure.audio.realtime_stt_adapter import RealtimeSTTAdapter, STTModel
 from ..infrastructure.audio.realtime_tts_adapter import RealtimeTTSAdapter
 
+# Utterances that end the conversation (compared after stripping punctuation and case)
+_EXIT_COMMANDS = frozenset({"exit", "quit", "goodbye"})
+
 
 class VoiceAgent:
     """
@@ -22,6 +29,8 @@ class VoiceAgent:
         llm_provider: str = "groq",
         llm_model: str | None = None,
         llm_temperature: float = 0.7,
+        verbose: bool = True,
+        llm: BaseChatModel | None = None,
     ):
         """
         Initialize the Voice Agent.
@@ -30,25 +39,79 @@ class VoiceAgent:
             llm_provider: LLM provider (groq, ollama)
             llm_model: Model name (uses provider default if None)
             llm_temperature: Model temperature
+            verbose: Echo the streamed response to the terminal
+            llm: Optional chat model shared across voice agents (keeps a per-agent conversation history)
         """
         logger.info("🤖 Initializing Voice Agent with LangGraph tools...")
 
-        # Initialize TTS adapter first (needed for interruption callback)
-        self.tts_adapter = RealtimeTTSAdapter()
+        self._init_adapters(llm_provider, llm_model, llm_temperature, llm)
+
+        # Buffered terminal echo of the streamed response (disable on headless devices)
+        self.verbose = verbose
+        self.stdout_writer = StreamWriter() if verbose else None
+
+        # Set from the STT thread when the user starts speaking over a response
+        self._interrupted = False
+
+        # Latest transcription waiting for the agent; a newer utterance simply replaces it
+        self._pending_text: str | None = None
+        self._text_ready = asyncio.Event()
+
+        # Background LLM warmup started by start_warmup(); kept referenced so it isn't garbage collected
+        self._warmup_task: asyncio.Task | None = None
 
-        # Initialize STT with interruption callback for immediate TTS stopping
-        self.stt_adapter = RealtimeSTTAdapter(
-            model=STTModel.TINY_EN,
-            language="en",
-            on_recording_start=self._on_recording_start,
-        )
+    def start_warmup(self) -> asyncio.Task:
+        """
+        Start warming up the LLM connection in the background.
+        Must be called from a running event loop that is not blocked afterwards
+        (e.g. await user input through asyncio.to_thread) for the warmup to overlap it.
+
+        Returns:
+            asyncio.Task: The warmup task
+        """
+        self._warmup_task = asyncio.create_task(self.langgraph_agent.warmup())
+        return self._warmup_task
 
-        # Initialize LangGraph agent for conversation and tool orchestration
-        self.langgraph_agent = LangGraphAgent(
-            llm_provider=llm_provider,
-            llm_model=llm_model,
-            llm_temperature=llm_temperature,
-        )
+    def _init_adapters(
+        self,
+        llm_provider: str,
+        llm_model: str | None,
+        llm_temperature: float,
+        llm: BaseChatModel | None,
+    ):
+        """
+        Construct the TTS, STT and LangGraph components concurrently.
+        Each one loads models or opens clients independently, so startup takes
+        as long as the slowest component instead of the sum of all three.
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            tts_future = executor.submit(self._create_tts_adapter)
+            # The recording callback only touches tts_adapter once listening starts
+            stt_future = executor.submit(
+                RealtimeSTTAdapter,
+                model=STTModel.TINY_EN,
+                language="en",
+                on_recording_start=self._on_recording_start,
+            )
+            agent_future = executor.submit(
+                LangGraphAgent,
+                llm_provider=llm_provider,
+                llm_model=llm_model,
+                llm_temperature=llm_temperature,
+                llm=llm,
+            )
+
+            # result() re-raises any error from the worker thread
+            self.tts_adapter = tts_future.result()
+            self.stt_adapter = stt_future.result()
+            self.langgraph_agent = agent_future.result()
+
+    @staticmethod
+    def _create_tts_adapter() -> RealtimeTTSAdapter:
+        """Create the TTS adapter and pay its voice/model load cost up front."""
+        tts_adapter = RealtimeTTSAdapter()
+        tts_adapter.warmup()
+        return tts_adapter
 
     def _on_recording_start(self):
         """
@@ -56,26 +119,35 @@ class VoiceAgent:
         Stops TTS playback instantly to prevent interference.
         This is the main interruption mechanism for responsiveness.
         """
+        self._interrupted = True
         self.tts_adapter.stop_playing()
 
-    async def _main_loop(self):
+    async def _stt_loop(self):
+        """
+        Speech-to-text task that processes microphone input and hands it to the agent loop.
+        Keeps listening while the agent responds. Returns when an exit command is heard.
         """
-        Speech-to-text task that processes microphone input and triggers agent responses.
+        async with aclosing(self.stt_adapter.transcriptions()) as transcriptions:
+            async for text in transcriptions:
+                logger.info(f"👤 User: {text}")
+                # Whisper usually punctuates single words ("Exit."), so strip before matching
+                if text.strip(" .,!?").casefold() in _EXIT_COMMANDS:
+                    logger.info("👋 Exit command received, ending conversation")
+                    break
+                # Only the latest utterance matters: overwrite any unprocessed one
+                self._pending_text = text
+                self._text_ready.set()
+
+    async def _agent_loop(self):
+        """
+        Agent task that responds to the most recent transcription.
         """
         while True:
-            try:
-                text = await self.stt_adapter.get_text_blocking()
-
-                if text:
-                    logger.info(f"👤 User: {text}")
-                    # Process with agent directly
-                    await self._process_user_input(text)
-                # If None, just continue listening (no error spam)
-
-            except Exception as e:
-                logger.error(f"❌ Error in STT task: {e}")
-                logger.error(f"Full traceback:\n{traceback.format_exc()}")
-                continue
+            await self._text_ready.wait()
+            self._text_ready.clear()
+            text, self._pending_text = self._pending_text, None
+            if text:
+                await self._process_user_input(text)
 
     async def _process_user_input(self, user_input: str):
         """
@@ -86,24 +158,47 @@ class VoiceAgent:
 
             # Stop any ongoing TTS playback immediately
             self.tts_adapter.stop_playing()
-
-            # Stream response with immediate TTS feeding for low latency
-            first_chunk = True
-
-            async for chunk in self.langgraph_agent.stream(user_message=user_input):
-                if chunk:
-                    # Immediately feed to TTS - true streaming!
-                    self.tts_adapter.feed_text(chunk)
-                    # Start TTS playback on first chunk
-                    if first_chunk:
-                        self.tts_adapter.play_stream_async()
-                        first_chunk = False
-                    print(chunk, end="", flush=True)
-            print()
+            self._interrupted = False
+
+            # Stream response, feeding TTS one sentence at a time
+            accumulator = TokenAccumulator()
+
+            # Bind per-token calls once, outside the streaming loop
+            feed_text = self.tts_adapter.feed_text
+            verbose = self.verbose
+            write = self.stdout_writer.write if verbose else None
+
+            # aclosing() ends the LLM request right away if we stop reading early
+            async with aclosing(self.langgraph_agent.stream(user_message=user_input)) as stream:
+                async for chunk in stream:
+                    # User barged in: stop generating so no stale text reaches TTS
+                    if self._interrupted:
+                        logger.info("✋ Response interrupted by user")
+                        accumulator.flush()
+                        break
+                    if chunk:
+                        if verbose:
+                            write(chunk)
+                        sentence = accumulator.push(chunk)
+                        if sentence:
+                            feed_text(sentence)
+                            # Start TTS playback on the first sentence, or again if it already
+                            # finished (e.g. while a tool was running)
+                            if not self.tts_adapter.is_playing:
+                                self.tts_adapter.play_stream_async()
+
+            # Speak whatever followed the last sentence boundary
+            remainder = accumulator.flush()
+            if remainder:
+                feed_text(remainder)
+                if not self.tts_adapter.is_playing:
+                    self.tts_adapter.play_stream_async()
+            if verbose:
+                self.stdout_writer.flush()
+                print()
 
         except Exception as e:
-            logger.error(f"❌ Error processing user input: {e}")
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
+            logger.opt(exception=True).error(f"❌ Error processing user input: {e}")
 
     async def run_conversation(self):
         """
@@ -113,14 +208,24 @@ class VoiceAgent:
         logger.info("💡 Say something to begin, or say 'exit' to quit")
 
         try:
-            # Run STT task
-            await self._main_loop()
+            agent_task = asyncio.create_task(self._agent_loop())
+            try:
+                # Run STT task until an exit command is heard
+                await self._stt_loop()
+            finally:
+                # Let the cancelled tasks finish their in-flight LLM requests before closing the client
+                background_tasks = [agent_task]
+                if self._warmup_task is not None:
+                    background_tasks.append(self._warmup_task)
+                for task in background_tasks:
+                    task.cancel()
+                await asyncio.gather(*background_tasks, return_exceptions=True)
+                await self.langgraph_agent.aclose()
 
         except KeyboardInterrupt:
             logger.info("\n⏹️  Conversation interrupted by user")
         except Exception as e:
-            logger.error(f"❌ Error in conversation: {e}")
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
+            logger.opt(exception=True).error(f"❌ Error in conversation: {e}")
 
     def get_info(self) -> dict[str, Any]:
         """Get information about the voice agent."""
@@ -1,20 +1,30 @@
 """LangGraph agent using prebuilt create_react_agent with configurable LLM providers."""
 
+import asyncio
+import re
+import unicodedata
+from collections import deque
 from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from typing import Any
 
 from dotenv import load_dotenv
+from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langgraph.prebuilt import create_react_agent
 from loguru import logger
 
 from voice_agent_course.domain.prompts.system_prompts import DEFAULT_SYSTEM_PROMPT
+from voice_agent_course.infrastructure.cache.response_cache import ResponseCache
 from voice_agent_course.infrastructure.llm_providers import LLMProviderFactory
 
 from ..tools.mock_tools import MOCK_TOOLS
 
 load_dotenv()
 
+# Cached responses are replayed word by word, like streamed tokens
+_REPLAY_PIECE = re.compile(r"\s*\S+")
+
 
 class LangGraphAgent:
     """LangGraph agent using prebuilt create_react_agent with configurable LLM providers."""
@@ -24,6 +34,7 @@ class LangGraphAgent:
         llm_provider: str = "groq",
         llm_model: str | None = None,
         llm_temperature: float = 0.7,
+        llm: BaseChatModel | None = None,
     ):
         """
         Initialize LangGraph agent.
@@ -32,16 +43,21 @@ class LangGraphAgent:
             llm_provider: LLM provider (groq, ollama)
             llm_model: Model name (uses provider default if None)
             llm_temperature: Model temperature
+            llm: Optional chat model shared between agents (e.g. one per server instead of one per
+                caller); the provider/model arguments should describe it
         """
         self.llm_provider = llm_provider
         self.llm_model = llm_model or LLMProviderFactory.get_default_model(llm_provider)
         self.llm_temperature = llm_temperature
         self.max_history_turns = 3
-        self.conversation_history: list[BaseMessage] = []
+        # Bounded to the last max_history_turns turns (each turn = human + ai message)
+        self.conversation_history: deque[BaseMessage] = deque(maxlen=self.max_history_turns * 2)
         self.tools = list(MOCK_TOOLS)
+        self.response_cache = ResponseCache()
 
-        # Initialize LLM using factory
-        self.llm = LLMProviderFactory.create_llm(
+        # Initialize LLM using factory, unless a shared one was provided (its owner closes it)
+        self._owns_llm = llm is None
+        self.llm = llm or LLMProviderFactory.create_llm(
             provider=self.llm_provider,
             model=self.llm_model,
             temperature=self.llm_temperature,
@@ -51,12 +67,20 @@ class LangGraphAgent:
         self._create_agent()
 
     def _create_agent(self):
-        """Create or recreate the agent with current tools."""
+        """
+        Create or recreate the agent with current tools.
+
+        The prompt must stay a constant string: a callable or per-turn formatting would change
+        the request prefix every turn and defeat the provider's prompt caching. Pass dynamic
+        context as messages in stream() instead.
+        """
         self.agent = create_react_agent(
             model=self.llm,
             tools=self.tools,
             prompt=DEFAULT_SYSTEM_PROMPT,
         )
+        # Tools may have changed, so forget answers given with the old ones
+        self.response_cache.clear()
 
     async def stream(self, user_message: str) -> AsyncGenerator[str, None]:
         """
@@ -68,11 +92,26 @@ class LangGraphAgent:
         Yields:
             str: Chunks of the agent's response (individual tokens)
         """
-        response_content = ""
+        response_parts: list[str] = []
+        used_tools = False
+
+        # Replay an earlier answer to the same request in the same context without calling the LLM
+        cache_key = self._cache_key(user_message)
+        cached_response = self.response_cache.get(cache_key) if cache_key is not None else None
+        if cached_response is not None:
+            logger.info("⚡ Serving response from cache")
+            # Replay in small pieces so sentence splitting and barge-in work as for a live stream
+            for piece in _REPLAY_PIECE.findall(cached_response):
+                yield piece
+                await asyncio.sleep(0)
+            # Like a live stream, an interrupted replay never reaches history
+            self._update_history(user_message, cached_response)
+            return
 
         try:
             # Prepare the input with conversation history
-            messages = self._get_recent_history() + [HumanMessage(content=user_message)]
+            messages = self._get_recent_history()
+            messages.append(HumanMessage(content=user_message))
             input_data = {"messages": messages}
 
             # Use astream_events to get token-level streaming
@@ -81,11 +120,12 @@ class LangGraphAgent:
                 if event["event"] == "on_chat_model_stream":
                     chunk = event["data"]["chunk"]
                     if hasattr(chunk, "content") and chunk.content:
-                        response_content += chunk.content
+                        response_parts.append(chunk.content)
                         yield chunk.content
 
                 # Also show tool usage
                 elif event["event"] == "on_tool_start":
+                    used_tools = True
                     tool_name = event["name"]
                     tool_msg = f"Using {tool_name} tool. "
                     logger.info(f"🛠️ {tool_msg}")
@@ -93,9 +133,13 @@ class LangGraphAgent:
                     # yield tool_msg
 
             # Update conversation history with the complete response
-            if response_content.strip():
-                # logger.info(f"🔍 {response_content.strip()}")
-                self._update_history(user_message, response_content.strip())
+            response_content = "".join(response_parts).strip()
+            if response_content:
+                # logger.info(f"🔍 {response_content}")
+                self._update_history(user_message, response_content)
+                # Tool results (weather, random numbers...) change between calls, so only cache plain replies
+                if cache_key is not None and not used_tools:
+                    self.response_cache.put(cache_key, response_content)
 
         except Exception as e:
             error_msg = f"Error: {str(e)}"
@@ -103,25 +147,52 @@ class LangGraphAgent:
             self._update_history(user_message, error_msg)
             yield error_msg
 
+    async def warmup(self):
+        """
+        Send a throwaway request so the first real turn doesn't pay connection or model load costs.
+        The reply is discarded after the first chunk and never touches history or the cache.
+        """
+        try:
+            async with aclosing(self.llm.astream([HumanMessage(content="Hi")])) as stream:
+                async for _ in stream:
+                    break
+            logger.info("🔥 LLM warmed up")
+        except Exception as e:
+            logger.warning(f"⚠️ LLM warmup failed: {e}")
+
+    async def aclose(self):
+        """Close the HTTP connections of the LLM this agent created."""
+        http_async_client = getattr(self.llm, "http_async_client", None)
+        if self._owns_llm and http_async_client is not None:
+            await http_async_client.aclose()
+
+    def _cache_key(self, user_message: str) -> tuple[tuple[tuple[str, str], ...], str] | None:
+        """
+        Build a response cache key from the recent history and the normalized message.
+
+        The history is the same trimmed tail sent to the LLM, so a short follow-up ("Why?") only
+        hits when it follows the same earlier turns. In the message, only case, whitespace and
+        trailing sentence punctuation are normalized, so STT variations of the same request match
+        while operators and signs ("10 - 5" vs "10 + 5") still differ.
+
+        Returns:
+            tuple | None: The (history, message) key, or None for an empty message
+        """
+        normalized_message = " ".join(unicodedata.normalize("NFC", user_message).casefold().split())
+        normalized_message = normalized_message.rstrip(".,!? ")
+        if not normalized_message:
+            return None
+        history = tuple((message.type, message.content) for message in self.conversation_history)
+        return history, normalized_message
+
     def _get_recent_history(self) -> list[BaseMessage]:
         """Get recent conversation history (last N turns)."""
-        if not self.conversation_history:
-            return []
-
-        # Keep last max_history_turns * 2 messages (each turn = human + ai message)
-        max_messages = self.max_history_turns * 2
-        return self.conversation_history[-max_messages:]
+        return list(self.conversation_history)
 
     def _update_history(self, user_message: str, ai_response: str):
-        """Update conversation history with new turn."""
-        # Add new messages
+        """Update conversation history with new turn (the deque drops the oldest turn)."""
         self.conversation_history.extend([HumanMessage(content=user_message), AIMessage(content=ai_response)])
 
-        # Trim conversation history if needed
-        max_messages = self.max_history_turns * 2
-        if len(self.conversation_history) > max_messages:
-            self.conversation_history = self.conversation_history[-max_messages:]
-
     def get_info(self) -> dict[str, Any]:
         """Get information about the agent."""
         return {
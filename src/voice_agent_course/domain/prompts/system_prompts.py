@@ -61,4 +61,7 @@ For example:
 - Always reference the specific results you got from the tools in your final response
 """
 
+# Keep system prompts static (no timestamps, memories or generated tool docs) so every turn
+# shares the same prefix and providers can reuse its cached prefill. Per-turn context belongs
+# in separate messages after the system prompt.
 DEFAULT_SYSTEM_PROMPT = ENHANCED_VOICE_AGENT
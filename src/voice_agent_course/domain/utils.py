@@ -0,0 +1,173 @@
+"""Shared helpers for streaming agent output."""
+
+import sys
+import time
+from typing import BinaryIO
+
+
+class StreamWriter:
+    """
+    Buffered writer for streamed response tokens.
+    Coalesces per-token writes so the terminal is written and flushed
+    every few tokens instead of once per token.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO | None = None,
+        flush_interval: float = 0.05,
+        max_buffer_size: int = 256,
+    ):
+        """
+        Initialize the stream writer.
+
+        Args:
+            stream: Binary stream to write to (defaults to sys.stdout, resolved at flush time)
+            flush_interval: Maximum time (seconds) text may sit in the buffer
+            max_buffer_size: Buffered bytes that force a flush
+        """
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+
+        self._buffer = bytearray()
+        self._last_flush = time.monotonic()
+
+    def write(self, text: str) -> None:
+        """Buffer text, flushing on newlines, when the buffer is full or once the flush interval has passed."""
+        self._buffer += text.encode("utf-8")
+        if (
+            "\n" in text
+            or len(self._buffer) >= self.max_buffer_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered text and flush the underlying stream."""
+        if self.stream is not None:
+            if self._buffer:
+                self.stream.write(self._buffer)
+            self.stream.flush()
+        else:
+            self._flush_to_stdout()
+        self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def _flush_to_stdout(self) -> None:
+        """Write to the current sys.stdout, as raw bytes when it exposes a binary buffer."""
+        stdout = sys.stdout
+        binary = getattr(stdout, "buffer", None)
+        if binary is None:
+            # Captured or redirected stdout (IDEs, notebooks) may be text-only
+            if self._buffer:
+                stdout.write(self._buffer.decode("utf-8"))
+            stdout.flush()
+            return
+
+        # Push out pending print() output first so bytes don't overtake it
+        stdout.flush()
+        if self._buffer:
+            binary.write(self._buffer)
+        binary.flush()
+
+
+class TokenAccumulator:
+    """
+    Accumulates streamed LLM tokens into sentence-sized pieces for TTS.
+    Feeding whole sentences avoids prosody artifacts from word-by-word synthesis,
+    while long clauses and a character water-mark bound how long text is held back.
+    The water-mark starts small and doubles after each piece, so the first audio
+    starts early and later pieces grow towards whole sentences.
+    """
+
+    SENTENCE_ENDINGS = (".", "!", "?", ";")
+    CLAUSE_ENDINGS = (",",)
+
+    def __init__(
+        self,
+        max_chars: int = 200,
+        min_clause_words: int = 4,
+        max_clause_words: int = 12,
+        first_chars: int = 40,
+    ):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            max_chars: Buffered characters that force a flush without a sentence ending
+            min_clause_words: Buffered words needed before a comma also triggers a flush
+            max_clause_words: Buffered words after which text is split at the last comma seen
+            first_chars: Initial water-mark at which text is split at the last space; doubles
+                after every piece up to max_chars
+        """
+        self.max_chars = max_chars
+        self.min_clause_words = min_clause_words
+        self.max_clause_words = max_clause_words
+        self.first_chars = first_chars
+        self._target_chars = min(first_chars, max_chars)
+        self._parts: list[str] = []
+        self._length = 0
+        self._words = 0
+        self._has_clause_break = False
+
+    def push(self, token: str) -> str | None:
+        """
+        Add a token to the buffer.
+
+        Args:
+            token: Streamed text chunk
+
+        Returns:
+            str | None: The buffered text once it ends a sentence, a long enough clause
+            or reaches max_chars, otherwise None
+        """
+        self._parts.append(token)
+        self._length += len(token)
+        # Words are approximated by spaces, since tokens often split words
+        self._words += token.count(" ")
+        if not self._has_clause_break:
+            self._has_clause_break = any(ending in token for ending in self.CLAUSE_ENDINGS)
+
+        tail = token.rstrip()
+        if (
+            self._length >= self.max_chars
+            or tail.endswith(self.SENTENCE_ENDINGS)
+            or (tail.endswith(self.CLAUSE_ENDINGS) and self._words >= self.min_clause_words)
+        ):
+            return self.flush()
+        # A long sentence stalls synthesis, so hand over everything up to its last comma
+        if self._has_clause_break and self._words >= self.max_clause_words:
+            return self._split_after_last(self.CLAUSE_ENDINGS)
+        # Past the current water-mark, hand over whole words only
+        if self._length >= self._target_chars:
+            return self._split_after_last((" ",))
+        return None
+
+    def flush(self) -> str:
+        """Return and clear whatever text is buffered."""
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._length = 0
+        self._words = 0
+        self._has_clause_break = False
+        if text:
+            self._target_chars = min(self._target_chars * 2, self.max_chars)
+        return text
+
+    def _split_after_last(self, separators: tuple[str, ...]) -> str | None:
+        """Return the buffered text up to the last separator, keeping the rest buffered."""
+        text = "".join(self._parts)
+        cut = max(text.rfind(separator) for separator in separators) + 1
+        # Nothing worth speaking before the separator (e.g. only a leading space)
+        if cut <= 0 or not text[:cut].strip():
+            return None
+
+        self.flush()
+        rest = text[cut:]
+        if rest:
+            self._parts.append(rest)
+            self._length = len(rest)
+            self._words = rest.count(" ")
+            self._has_clause_break = any(ending in rest for ending in self.CLAUSE_ENDINGS)
+        return text[:cut]
@@ -1,12 +1,15 @@
 import asyncio
-import traceback
-from collections.abc import Callable
+import threading
+from collections.abc import AsyncGenerator, Callable
 from enum import Enum
 from typing import Any
 
 from loguru import logger
 from RealtimeSTT import AudioToTextRecorder
 
+# Transcriptions buffered for a slow consumer before the oldest ones are dropped
+_TRANSCRIPTION_QUEUE_SIZE = 4
+
 
 class STTModel(Enum):
     """Available STT models for different use cases"""
@@ -34,6 +37,7 @@ class RealtimeSTTAdapter:
         self,
         on_transcription: Callable[[str], None] | None = None,
         on_recording_start: Callable[[], None] | None = None,
+        on_partial_transcription: Callable[[str], None] | None = None,
         model: STTModel = STTModel.TINY_EN,
         language: str = "en",
         enable_realtime: bool = False,
@@ -45,6 +49,8 @@ class RealtimeSTTAdapter:
         Args:
             engine: Optional STT engine (for dependency injection in tests)
             on_transcription: Callback for final transcriptions
+            on_recording_start: Callback fired as soon as voice activity starts recording
+            on_partial_transcription: Callback for interim transcriptions (requires enable_realtime)
             model: STT model to use (affects speed vs accuracy)
             language: Language for transcription
             enable_realtime: Enable real-time partial transcriptions
@@ -52,6 +58,7 @@ class RealtimeSTTAdapter:
         """
         self.on_transcription = on_transcription
         self.on_recording_start = on_recording_start
+        self.on_partial_transcription = on_partial_transcription
         self.model = model
         self.language = language
         self.enable_realtime = enable_realtime
@@ -65,6 +72,12 @@ class RealtimeSTTAdapter:
             "min_gap_between_recordings": 0.1,
         }
 
+        # One listener thread per adapter, started by the first transcriptions() call and handed
+        # from consumer to consumer, so a new call never loses an utterance to a leftover thread
+        self._listener: threading.Thread | None = None
+        self._consumer: tuple[asyncio.AbstractEventLoop, asyncio.Queue[str]] | None = None
+        self._consumer_changed = threading.Condition()
+
         self._initialize_engine_stt()
 
     def _initialize_engine_stt(self):
@@ -90,7 +103,7 @@ class RealtimeSTTAdapter:
                 recorder_config.update(
                     {
                         "enable_realtime_transcription": True,
-                        # add callbacks for realtime transcriptions
+                        "on_realtime_transcription_update": self._on_partial_transcription,
                     }
                 )
 
@@ -99,8 +112,7 @@ class RealtimeSTTAdapter:
             logger.info("✅ STT engine initialized and ready!")
 
         except Exception as e:
-            logger.error(f"❌ Error creating AudioToTextRecorder: {e}")
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
+            logger.opt(exception=True).error(f"❌ Error creating AudioToTextRecorder: {e}")
             raise
 
     def _on_recording_start(self, *args, **kwargs):
@@ -160,6 +172,84 @@ class RealtimeSTTAdapter:
                 return None
 
         except Exception as e:
-            logger.error(f"STT error: {e}")
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
+            logger.opt(exception=True).error(f"STT error: {e}")
             return None
+
+    def __aiter__(self) -> AsyncGenerator[str, None]:
+        return self.transcriptions()
+
+    async def transcriptions(self) -> AsyncGenerator[str, None]:
+        """
+        Yield final transcriptions as they are recognized.
+
+        A single listener thread keeps calling the recorder and hands each text to the event loop
+        with call_soon_threadsafe, instead of a thread-pool round trip per utterance. If the consumer
+        falls behind, the oldest queued transcriptions are dropped. Only one consumer may iterate at
+        a time; once it closes, the next call picks up where it left off.
+
+        Yields:
+            str: Transcribed text (never empty)
+
+        Raises:
+            RuntimeError: If another transcriptions() iterator is still open
+        """
+        if not hasattr(self, "engine") or self.engine is None:
+            logger.error("STT engine not available")
+            return
+
+        consumer = (asyncio.get_running_loop(), asyncio.Queue(maxsize=_TRANSCRIPTION_QUEUE_SIZE))
+        with self._consumer_changed:
+            if self._consumer is not None:
+                raise RuntimeError("transcriptions() is already being consumed")
+            self._consumer = consumer
+            self._consumer_changed.notify_all()
+
+        if self._listener is None:
+            # Daemon thread: a pending recorder call only returns on the next utterance
+            self._listener = threading.Thread(target=self._listen, name="stt-listener", daemon=True)
+            self._listener.start()
+
+        queue = consumer[1]
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            with self._consumer_changed:
+                self._consumer = None
+
+    def _listen(self):
+        """Runs on the listener thread, waiting for a consumer before each recorder call."""
+        while True:
+            with self._consumer_changed:
+                self._consumer_changed.wait_for(lambda: self._consumer is not None)
+            try:
+                text = self.engine.text()
+            except Exception as e:
+                logger.opt(exception=True).error(f"STT error: {e}")
+                continue
+            text = text.strip() if text else ""
+            # No speech detected is normal, just keep listening
+            if not text:
+                continue
+
+            # The consumer may have closed while the recorder was blocked: keep the text for the next one
+            with self._consumer_changed:
+                self._consumer_changed.wait_for(lambda: self._consumer is not None)
+                consumer = self._consumer
+            loop = consumer[0]
+            try:
+                loop.call_soon_threadsafe(self._deliver, consumer, text)
+            except RuntimeError:
+                # Event loop already closed
+                logger.warning("⚠️ Dropped a transcription: its event loop is closed")
+
+    def _deliver(self, consumer: tuple[asyncio.AbstractEventLoop, asyncio.Queue[str]], text: str):
+        """Runs on the consumer's event loop thread."""
+        if self._consumer is not consumer:
+            return
+        queue = consumer[1]
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(text)
+        if self.on_transcription:
+            self.on_transcription(text)
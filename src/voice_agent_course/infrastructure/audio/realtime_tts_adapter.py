@@ -1,5 +1,3 @@
-import traceback
-
 from loguru import logger
 from RealtimeTTS import KokoroEngine, TextToAudioStream
 
@@ -53,19 +51,48 @@ class RealtimeTTSAdapter:
         self.engine = KokoroEngine()
         self.engine.set_voice("af_heart")
         self.engine.set_speed(1.0)
-        self.stream = self._initialize_stream()
 
         # State tracking
         self.is_playing: bool = False
 
+        self.stream = self._initialize_stream()
+
     def _initialize_stream(self) -> TextToAudioStream:
         """Initialize Kokoro engine and stream"""
         return TextToAudioStream(
             self.engine,
             frames_per_buffer=self.frames_per_buffer,
             playout_chunk_size=self.playout_chunk_size,
+            on_audio_stream_stop=self._on_audio_stream_stop,
         )
 
+    def _on_audio_stream_stop(self) -> None:
+        """
+        Called by RealtimeTTS (from its playback thread) when playback ends.
+        Text fed during playback has been played by then, so there is nothing left to stop.
+        """
+        self.is_playing = False
+
+    def warmup(self, text: str = "Hello.") -> None:
+        """
+        Synthesize a short muted phrase so the voice and model are loaded before the first reply.
+
+        Args:
+            text: Phrase to synthesize (never played through the speakers)
+        """
+        try:
+            logger.info("🔥 Warming up TTS engine...")
+            self.stream.feed(text)
+            self.stream.play(muted=True)
+            logger.info("✅ TTS engine warmed up")
+        except Exception as e:
+            logger.opt(exception=True).error(f"⚠️  TTS warmup failed: {e}")
+            # Discard the warmup text so it is not spoken ahead of the first reply
+            try:
+                self.stream.stop()
+            except Exception as stop_error:
+                logger.opt(exception=True).error(f"❌ Error clearing TTS warmup text: {stop_error}")
+
     def feed_text(self, text: str) -> None:
         """Feed text to the stream for streaming synthesis."""
         self.stream.feed(text)
@@ -84,21 +111,23 @@ class RealtimeTTSAdapter:
             )
             return True
         except Exception as e:
-            logger.error(f"❌ Error starting TTS playback: {e}")
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
+            logger.opt(exception=True).error(f"❌ Error starting TTS playback: {e}")
             self.is_playing = False
             return False
 
     def stop_playing(self) -> None:
         """Stop the current playback immediately using official RealtimeTTS API."""
+        # Playback already ended or was stopped, so there is no audio or leftover text to discard
+        if not self.is_playing:
+            return
+
         logger.info("⏹️  Stopping TTS playback...")
         try:
-            # Only try to stop if we're actually playing
-            if self.is_playing and hasattr(self.stream, "stop"):
+            if hasattr(self.stream, "stop"):
                 self.stream.stop()
                 logger.info("🛑 Speech streaming should stop immediately")
             else:
-                logger.info("ℹ️  TTS not playing or no stop method available")
+                logger.info("ℹ️  No stop method available")
 
             # Reset state
             self.is_playing = False
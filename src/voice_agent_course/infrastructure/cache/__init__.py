@@ -0,0 +1 @@
+# Cache infrastructure - in-memory response caching
@@ -0,0 +1,49 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of complete agent responses.
+    Lets repeated requests skip the LLM round trip entirely.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = 3600.0):
+        """
+        Initialize the response cache.
+
+        Args:
+            maxsize: Maximum number of cached responses (least recently used are evicted)
+            ttl: Seconds a response stays valid, expiring once reached (None keeps entries until evicted)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[str, float]] = OrderedDict()
+
+    def get(self, key: Hashable) -> str | None:
+        """Return the cached response for key, or None on a miss or if it expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        response, stored_at = entry
+        if self.ttl is not None and time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: Hashable, response: str) -> None:
+        """Cache a response, evicting the least recently used entry if full."""
+        self._entries[key] = (response, time.monotonic())
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,6 +3,8 @@
 from enum import Enum
 from typing import Any
 
+import httpx
+from groq import DefaultAsyncHttpxClient
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_groq import ChatGroq
 from langchain_ollama import ChatOllama
@@ -65,12 +67,29 @@ class LLMProviderFactory:
             model = self.DEFAULT_MODELS[provider]
 
         if provider == LLMProvider.GROQ:
+            # Only build our own client when the caller didn't pass one (setdefault would build it anyway)
+            if "http_async_client" not in kwargs:
+                kwargs["http_async_client"] = self.create_groq_http_async_client()
             return ChatGroq(model=model, temperature=temperature, **kwargs)
         elif provider == LLMProvider.OLLAMA:
             return ChatOllama(model=model, temperature=temperature, **kwargs)
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
 
+    @staticmethod
+    def create_groq_http_async_client() -> httpx.AsyncClient:
+        """
+        Create an async HTTP client for Groq requests with a longer keep-alive.
+
+        The Groq SDK default drops idle connections after 5 seconds, which is shorter than
+        a typical pause between voice turns, so every turn would pay a new TLS handshake.
+        The client's connections belong to the event loop that first uses it, so each LLM gets
+        its own client; its owner should close it (aclose) on shutdown.
+        """
+        return DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0),
+        )
+
     @classmethod
     def get_available_providers(cls) -> list[str]:
         """Get list of available providers."""
@@ -0,0 +1,102 @@
+import asyncio
+from contextlib import aclosing
+from types import SimpleNamespace
+
+import pytest
+
+from voice_agent_course.domain.agents.langgraph_agent import LangGraphAgent
+
+
+class FakeGraph:
+    """Stands in for the compiled ReAct agent, streaming a fixed reply per call."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    async def astream_events(self, input_data, version):
+        self.calls += 1
+        for token in self.replies.pop(0):
+            yield {"event": "on_chat_model_stream", "data": {"chunk": SimpleNamespace(content=token)}}
+
+
+@pytest.fixture
+def agent():
+    # Ollama needs no API key and doesn't connect until a request is made
+    return LangGraphAgent(llm_provider="ollama")
+
+
+def test_cache_key_normalizes_case_whitespace_and_trailing_punctuation(agent):
+    assert agent._cache_key("What's the capital of  France?") == agent._cache_key("what's the capital of france")
+
+
+def test_cache_key_keeps_operators_and_signs(agent):
+    keys = {agent._cache_key(message) for message in ["What's 10 + 5?", "What's 10 - 5?", "What's 10 / 5?"]}
+
+    assert len(keys) == 3
+    assert agent._cache_key("Add -5") != agent._cache_key("Add 5")
+
+
+def test_cache_key_depends_on_recent_history(agent):
+    key = agent._cache_key("Why?")
+    agent._update_history("What's the capital of France?", "Paris.")
+
+    assert agent._cache_key("Why?") != key
+
+
+async def ask(agent, message):
+    return "".join([chunk async for chunk in agent.stream(message)])
+
+
+def test_stream_serves_repeated_request_from_cache(agent):
+    agent.agent = FakeGraph([["Paris", " is the capital."]])
+
+    async def conversation():
+        first = await ask(agent, "What's the capital of France?")
+        # A new conversation starts from the same (empty) history
+        agent.conversation_history.clear()
+        repeated = await ask(agent, "what's the capital of france")
+        return first, repeated
+
+    first, repeated = asyncio.run(conversation())
+
+    assert repeated == first == "Paris is the capital."
+    assert agent.agent.calls == 1
+
+
+def test_interrupted_cache_replay_is_not_recorded_in_history(agent):
+    agent.agent = FakeGraph([["Paris", " is the capital."]])
+
+    async def conversation():
+        await ask(agent, "What's the capital of France?")
+        agent.conversation_history.clear()
+        async with aclosing(agent.stream("What's the capital of France?")) as stream:
+            async for _ in stream:
+                break
+
+    asyncio.run(conversation())
+
+    assert agent.agent.calls == 1
+    assert not agent.conversation_history
+
+
+def test_stream_does_not_replay_follow_up_from_another_context(agent):
+    agent.agent = FakeGraph(
+        [
+            ["Paris."],
+            ["Because it was the seat of the Frankish kings."],
+            ["Rome."],
+            ["Because it was the center of the Roman Empire."],
+        ]
+    )
+
+    async def conversation():
+        await ask(agent, "What's the capital of France?")
+        await ask(agent, "Why?")
+        await ask(agent, "What's the capital of Italy?")
+        return await ask(agent, "Why?")
+
+    answer = asyncio.run(conversation())
+
+    assert answer == "Because it was the center of the Roman Empire."
+    assert agent.agent.calls == 4
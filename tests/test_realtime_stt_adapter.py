@@ -0,0 +1,102 @@
+import asyncio
+import queue
+from contextlib import aclosing
+
+import pytest
+
+pytest.importorskip("RealtimeSTT")
+
+from voice_agent_course.infrastructure.audio import realtime_stt_adapter  # noqa: E402
+from voice_agent_course.infrastructure.audio.realtime_stt_adapter import RealtimeSTTAdapter  # noqa: E402
+
+
+class FakeRecorder:
+    """Stands in for AudioToTextRecorder: text() blocks until the test queues an utterance."""
+
+    def __init__(self, **config):
+        self.utterances = queue.Queue()
+
+    def text(self):
+        return self.utterances.get()
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    monkeypatch.setattr(realtime_stt_adapter, "AudioToTextRecorder", FakeRecorder)
+    delivered = []
+    adapter = RealtimeSTTAdapter(on_transcription=delivered.append)
+    adapter.delivered = delivered
+    return adapter
+
+
+async def wait_for_deliveries(adapter, count):
+    while len(adapter.delivered) < count:
+        await asyncio.sleep(0.01)
+
+
+def test_transcriptions_drop_the_oldest_when_the_consumer_falls_behind(adapter):
+    async def consume():
+        transcriptions = adapter.transcriptions()
+        adapter.engine.utterances.put("0")
+        assert await asyncio.wait_for(anext(transcriptions), 1) == "0"
+
+        # Nobody reads while these arrive
+        for number in range(1, 7):
+            adapter.engine.utterances.put(f" {number} ")
+        await asyncio.wait_for(wait_for_deliveries(adapter, 7), 1)
+
+        texts = [await asyncio.wait_for(anext(transcriptions), 1) for _ in range(4)]
+        await transcriptions.aclose()
+        return texts
+
+    texts = asyncio.run(consume())
+
+    assert realtime_stt_adapter._TRANSCRIPTION_QUEUE_SIZE == 4
+    assert texts == ["3", "4", "5", "6"]
+
+
+def test_transcriptions_skip_empty_results(adapter):
+    async def consume():
+        transcriptions = adapter.transcriptions()
+        for text in ["", "  ", None, "Hello"]:
+            adapter.engine.utterances.put(text)
+        text = await asyncio.wait_for(anext(transcriptions), 1)
+        await transcriptions.aclose()
+        return text
+
+    assert asyncio.run(consume()) == "Hello"
+
+
+def test_a_new_consumer_gets_the_utterance_heard_after_the_last_one_closed(adapter):
+    async def consume_one():
+        async with aclosing(adapter.transcriptions()) as transcriptions:
+            return await asyncio.wait_for(anext(transcriptions), 1)
+
+    async def conversation():
+        adapter.engine.utterances.put("first")
+        first = await consume_one()
+        listener = adapter._listener
+
+        # Arrives while nobody is consuming, e.g. between two conversations
+        adapter.engine.utterances.put("second")
+        second = await consume_one()
+        return first, second, listener
+
+    first, second, listener = asyncio.run(conversation())
+
+    assert (first, second) == ("first", "second")
+    assert adapter._listener is listener
+
+
+def test_transcriptions_reject_a_second_concurrent_consumer(adapter):
+    async def consume():
+        transcriptions = adapter.transcriptions()
+        adapter.engine.utterances.put("Hello")
+        await asyncio.wait_for(anext(transcriptions), 1)
+        try:
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(anext(adapter.transcriptions()), 1)
+        finally:
+            await transcriptions.aclose()
+
+    asyncio.run(consume())
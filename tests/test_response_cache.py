@@ -0,0 +1,30 @@
+from voice_agent_course.infrastructure.cache.response_cache import ResponseCache
+
+
+def test_response_cache_hit_and_miss():
+    cache = ResponseCache()
+    cache.put("hello", "Hi there!")
+
+    assert cache.get("hello") == "Hi there!"
+    assert cache.get("goodbye") is None
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(maxsize=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.get("a")
+    cache.put("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert len(cache) == 2
+
+
+def test_response_cache_expires_entries_after_ttl():
+    cache = ResponseCache(ttl=0.0)
+    cache.put("hello", "Hi there!")
+
+    assert cache.get("hello") is None
+    assert len(cache) == 0
@@ -0,0 +1,93 @@
+import io
+import sys
+
+from voice_agent_course.domain.utils import StreamWriter, TokenAccumulator
+
+
+def test_stream_writer_buffers_small_writes():
+    stream = io.BytesIO()
+    writer = StreamWriter(stream=stream, flush_interval=60.0, max_buffer_size=256)
+
+    writer.write("Hello")
+    writer.write(" world")
+    assert stream.getvalue() == b""
+
+    writer.flush()
+    assert stream.getvalue() == b"Hello world"
+
+
+def test_stream_writer_flushes_when_buffer_is_full():
+    stream = io.BytesIO()
+    writer = StreamWriter(stream=stream, flush_interval=60.0, max_buffer_size=8)
+
+    writer.write("1234")
+    writer.write("5678")
+    assert stream.getvalue() == b"12345678"
+
+
+def test_token_accumulator_flushes_on_sentence_end():
+    accumulator = TokenAccumulator()
+
+    assert accumulator.push("Hello") is None
+    assert accumulator.push(" there.") == "Hello there."
+    assert accumulator.push(" How") is None
+    assert accumulator.flush() == " How"
+    assert accumulator.flush() == ""
+
+
+def test_token_accumulator_flushes_at_max_chars():
+    accumulator = TokenAccumulator(max_chars=10)
+
+    assert accumulator.push("one two") is None
+    assert accumulator.push(" three") == "one two three"
+
+
+def test_stream_writer_flushes_on_newline():
+    stream = io.BytesIO()
+    writer = StreamWriter(stream=stream, flush_interval=60.0, max_buffer_size=256)
+
+    writer.write("First line\n")
+    assert stream.getvalue() == b"First line\n"
+
+
+def test_token_accumulator_flushes_long_clauses_on_comma():
+    accumulator = TokenAccumulator()
+
+    assert accumulator.push("Sure,") is None
+    assert accumulator.push(" the weather in Paris is sunny,") == "Sure, the weather in Paris is sunny,"
+
+
+def test_token_accumulator_splits_long_sentences_at_last_comma():
+    accumulator = TokenAccumulator(max_clause_words=12)
+
+    assert accumulator.push("Paris is sunny today, with light winds") is None
+    assert accumulator.push(" from the west and clear skies") == "Paris is sunny today,"
+    assert accumulator.flush() == " with light winds from the west and clear skies"
+
+
+def test_token_accumulator_grows_pieces_after_the_first():
+    accumulator = TokenAccumulator(max_chars=200, first_chars=20)
+
+    assert accumulator.push("Paris is sunny and") is None
+    assert accumulator.push(" warm") == "Paris is sunny and "
+    assert accumulator.push(" with light winds from") is None
+    assert accumulator.push(" the west") is None
+    assert accumulator.flush() == "warm with light winds from the west"
+
+
+def test_token_accumulator_never_splits_off_only_whitespace():
+    accumulator = TokenAccumulator(max_chars=200, first_chars=20)
+
+    assert accumulator.push(" Supercalifragilisticexpialidocious") is None
+    assert accumulator.push(" is") == " Supercalifragilisticexpialidocious "
+    assert accumulator.flush() == "is"
+
+
+def test_stream_writer_falls_back_to_text_stdout(monkeypatch):
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    writer = StreamWriter(flush_interval=60.0)
+
+    writer.write("Hello")
+    writer.flush()
+    assert stdout.getvalue() == "Hello"
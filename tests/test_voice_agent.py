@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("RealtimeSTT")
+pytest.importorskip("RealtimeTTS")
+
+from voice_agent_course.application.voice_agent import VoiceAgent  # noqa: E402
+
+
+class FakeTTS:
+    """Records fed text and playback calls instead of synthesizing audio."""
+
+    def __init__(self):
+        self.fed = []
+        self.plays = 0
+        self.is_playing = False
+
+    def feed_text(self, text):
+        self.fed.append(text)
+
+    def play_stream_async(self):
+        self.plays += 1
+        self.is_playing = True
+        return True
+
+    def stop_playing(self):
+        self.is_playing = False
+
+
+class FakeSTT:
+    """Yields batches of transcriptions, letting the event loop run between batches."""
+
+    def __init__(self, batches):
+        self.batches = batches
+
+    async def transcriptions(self):
+        for batch in self.batches:
+            await asyncio.sleep(0.05)
+            for text in batch:
+                yield text
+
+
+class FakeAgent:
+    """Streams a fixed reply, calling after_token once each token has been consumed."""
+
+    def __init__(self, tokens, after_token=None):
+        self.tokens = tokens
+        self.after_token = after_token
+        self.calls = []
+        self.stream_closed = False
+        self.warmup_cancelled = False
+        self.closed = False
+        self.warmup_cancelled_before_close = False
+
+    async def stream(self, user_message):
+        self.calls.append(user_message)
+        try:
+            for token in self.tokens:
+                yield token
+                if self.after_token:
+                    self.after_token(token)
+        finally:
+            self.stream_closed = True
+
+    async def warmup(self):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.warmup_cancelled = True
+            raise
+
+    async def aclose(self):
+        self.closed = True
+        self.warmup_cancelled_before_close = self.warmup_cancelled
+
+
+def build_voice_agent(tts, stt, agent):
+    # Skip __init__, which loads the real STT/TTS models
+    voice_agent = object.__new__(VoiceAgent)
+    voice_agent.tts_adapter = tts
+    voice_agent.stt_adapter = stt
+    voice_agent.langgraph_agent = agent
+    voice_agent.verbose = False
+    voice_agent.stdout_writer = None
+    voice_agent._interrupted = False
+    voice_agent._pending_text = None
+    voice_agent._text_ready = asyncio.Event()
+    voice_agent._warmup_task = None
+    return voice_agent
+
+
+def test_agent_answers_only_the_latest_utterance_and_shuts_down():
+    agent = FakeAgent(["Sure."])
+    stt = FakeSTT([["What's the weather?", "Actually, what time is it?"], ["Goodbye."]])
+
+    async def conversation():
+        voice_agent = build_voice_agent(FakeTTS(), stt, agent)
+        voice_agent.start_warmup()
+        await voice_agent.run_conversation()
+
+    asyncio.run(conversation())
+
+    assert agent.calls == ["Actually, what time is it?"]
+    assert agent.closed
+    assert agent.warmup_cancelled_before_close
+
+
+def test_barge_in_stops_feeding_the_response():
+    tts = FakeTTS()
+    voice_agent = build_voice_agent(tts, None, None)
+
+    def interrupt_after_first_sentence(token):
+        if token.endswith("."):
+            voice_agent._on_recording_start()
+
+    agent = FakeAgent(["Hello there.", " This should", " never be spoken."], interrupt_after_first_sentence)
+    voice_agent.langgraph_agent = agent
+
+    asyncio.run(voice_agent._process_user_input("Hi"))
+
+    assert tts.fed == ["Hello there."]
+    assert not tts.is_playing
+    assert agent.stream_closed
+
+
+def test_playback_restarts_after_it_ends_mid_response():
+    tts = FakeTTS()
+
+    def finish_playback_after_first_sentence(token):
+        if token == "Let me check.":
+            tts.is_playing = False
+
+    agent = FakeAgent(["Let me check.", " It is sunny.", " Anything else?"], finish_playback_after_first_sentence)
+    voice_agent = build_voice_agent(tts, None, agent)
+
+    asyncio.run(voice_agent._process_user_input("What's the weather?"))
+
+    assert tts.fed == ["Let me check.", " It is sunny.", " Anything else?"]
+    assert tts.plays == 2